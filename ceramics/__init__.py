@@ -0,0 +1 @@
+"""Ceramic classification and visualization pipeline (NPM ceramics collection)."""
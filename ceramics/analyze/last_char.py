@@ -1,3 +1,4 @@
+import os
 import json
 from collections import Counter
 
@@ -8,6 +9,10 @@ target_field = "name"
 # ===================
 
 def main():
+    if not os.path.exists(input_file_path):
+        print(f"❌ 找不到資料檔：{input_file_path}")
+        return
+
     with open(input_file_path, "r", encoding="utf-8") as f:
         raw_data = json.load(f)
     
@@ -29,6 +34,3 @@ def main():
             f.write(f"{char}\t{count}\n")
 
     print(f"✅ 分析完成，結果輸出至 {output_file_path}")
-
-if __name__ == "__main__":
-    main()
@@ -1,3 +1,4 @@
+import os
 import json
 import re
 from collections import Counter
@@ -30,6 +31,10 @@ def clean_and_split(text):
     return [t for t in tokens if t]
 
 def main():
+    if not os.path.exists(input_file_path):
+        print(f"❌ 找不到資料檔：{input_file_path}")
+        return
+
     with open(input_file_path, "r", encoding="utf-8") as f:
         raw_data = json.load(f)
     
@@ -76,6 +81,3 @@ def main():
                 break
 
     print(f"✅ 分析完成，結果輸出至 {output_file_path}")
-
-if __name__ == "__main__":
-    main()
@@ -1,18 +1,10 @@
+import os
 import json
 from collections import Counter
 
-# ===== args =====
-import argparse
-parser = argparse.ArgumentParser()
-parser.add_argument("--method", type=str, default="shape",
-                    help="分類方法名稱，decoraction / dynasty / glaze / kiln / shape")
-args = parser.parse_args()
-CLASSIFICATION_METHOD = args.method
-# =====================
-
 # ===== 手動設定 =====
-input_file_path = f"data/{CLASSIFICATION_METHOD}.json"
-output_file_path = f"data/{CLASSIFICATION_METHOD}.txt"
+input_file_path = "data/{method}.json"
+output_file_path = "data/{method}.txt"
 target_field = "class"
 
 '''
@@ -22,8 +14,15 @@ target_field = "era"
 '''
 # ===================
 
-def main():
-    with open(input_file_path, "r", encoding="utf-8") as f:
+def main(method="shape"):
+    input_path = input_file_path.format(method=method)
+    output_path = output_file_path.format(method=method)
+
+    if not os.path.exists(input_path):
+        print(f"❌ 找不到資料檔：{input_path}")
+        return
+
+    with open(input_path, "r", encoding="utf-8") as f:
         raw_data = json.load(f)
     
     # 移除「沒有圖片」的樣本
@@ -34,11 +33,8 @@ def main():
     counter = Counter(values)
     most_common = counter.most_common()
 
-    with open(output_file_path, "w", encoding="utf-8") as f:
+    with open(output_path, "w", encoding="utf-8") as f:
         for value, count in most_common:
             f.write(f"{value}\t{count}\n")
 
-    print(f"✅ 分析完成，結果輸出至 {output_file_path}")
-
-if __name__ == "__main__":
-    main()
+    print(f"✅ 分析完成，結果輸出至 {output_path}")
@@ -1,4 +1,4 @@
-# build_dataset.py
+# build.py
 import json
 import os
 
@@ -44,6 +44,9 @@ def sample_fixed_interval(data, limit=100):
 
 
 def main():
+    if not os.path.exists(RAW_PATH):
+        print(f"❌ 找不到原始資料：{RAW_PATH}")
+        return
     os.makedirs(OUT_DIR, exist_ok=True)
 
     with open(RAW_PATH, "r", encoding="utf-8") as f:
@@ -70,7 +73,3 @@ def main():
             json.dump(all_selected, f, ensure_ascii=False, indent=2)
 
         print(f"✅ {ds_name}: {len(all_selected)} items saved to {output_path}")
-
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
@@ -0,0 +1,96 @@
+import argparse
+import importlib
+from .common import METHODS, STORAGE_MODES
+
+# 子命令只在執行時才 import 對應模組，--help 與參數錯誤不會載入 torch / diffusers / umap 等套件
+
+
+def add_method(parser):
+    parser.add_argument("--method", type=str, default="shape", choices=METHODS,
+                        help="分類方法名稱，decoration / dynasty / glaze / kiln / shape")
+
+
+def non_negative_int(value):
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"必須為非負整數：{value}")
+    return number
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="ceramics",
+                                     description="NPM 陶瓷分類與視覺化流程")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="由 raw_data/ceramics.json 建立各分類資料集")
+    p.set_defaults(target="ceramics.build:main")
+
+    p = sub.add_parser("download", help="下載資料集圖片至 ./picture")
+    add_method(p)
+    p.set_defaults(target="ceramics.download:main")
+
+    p = sub.add_parser("dedup", help="以 pHash 偵測近似重複圖片")
+    add_method(p)
+    p.set_defaults(target="ceramics.dedup:main")
+
+    p = sub.add_parser("extract", help="VAE 特徵抽取 + 標準化 + PCA")
+    add_method(p)
+    p.add_argument("--dedup", action="store_true",
+                   help="略過 ceramics dedup 標記的近似重複圖片")
+    p.add_argument("--storage", type=str, default="float32", choices=STORAGE_MODES,
+                   help="原始 latent 儲存格式，float32 / float16 / int8（每 channel 量化）")
+    p.set_defaults(target="ceramics.extract:main")
+
+    p = sub.add_parser("verify-quant", help="比較各儲存格式的量化誤差")
+    add_method(p)
+    p.add_argument("--decode", action="store_true",
+                   help="以 VAE 解碼 mean object 並比較像素誤差 (PSNR)")
+    p.set_defaults(target="ceramics.verify_quantization:main")
+
+    p = sub.add_parser("cluster", help="UMAP 散點圖與群中心圖")
+    add_method(p)
+    p.set_defaults(target="ceramics.cluster:main")
+
+    p = sub.add_parser("separability", help="類別可分性統計")
+    add_method(p)
+    p.set_defaults(target="ceramics.separability:main")
+
+    p = sub.add_parser("meanobject", help="解碼各類別的 mean object")
+    add_method(p)
+    p.set_defaults(target="ceramics.meanobject:main")
+
+    p = sub.add_parser("pca-grid", help="沿 PCA #1 / #2 產生 4x4 grid")
+    add_method(p)
+    p.set_defaults(target="ceramics.pca_grid:main")
+
+    p = sub.add_parser("pca-animation", help="沿兩個 PCA component 產生循環動畫")
+    add_method(p)
+    p.add_argument("--components", type=non_negative_int, nargs=2, default=[0, 1],
+                   help="要走訪的兩個 PCA component 編號 (從 0 開始)")
+    p.add_argument("--format", dest="fmt", type=str, default="gif", choices=["gif", "mp4"],
+                   help="輸出格式 gif / mp4")
+    p.set_defaults(target="ceramics.pca_animation:main")
+
+    p = sub.add_parser("analyze", help="欄位文字分析工具")
+    tools = p.add_subparsers(dest="tool", required=True)
+    t = tools.add_parser("value-count", help="計算資料集欄位值出現次數")
+    add_method(t)
+    t.set_defaults(target="ceramics.analyze.value_count:main")
+    t = tools.add_parser("last-char", help="統計名稱最後一字")
+    t.set_defaults(target="ceramics.analyze.last_char:main")
+    t = tools.add_parser("ngrams", help="n-gram 統計")
+    t.set_defaults(target="ceramics.analyze.ngrams:main")
+    t = tools.add_parser("suffix-ngrams", help="特定結尾字的 n-gram 統計")
+    t.set_defaults(target="ceramics.analyze.suffix_ngrams:main")
+
+    return parser
+
+
+def main(argv=None):
+    args = vars(build_parser().parse_args(argv))
+    module_name, func_name = args.pop("target").split(":")
+    args.pop("command")
+    args.pop("tool", None)
+
+    func = getattr(importlib.import_module(module_name), func_name)
+    return func(**args)
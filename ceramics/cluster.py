@@ -1,23 +1,9 @@
 import os
 import json
 import numpy as np
-import matplotlib.pyplot as plt
-import umap
-from sklearn.preprocessing import LabelEncoder
-
-# ===== args =====
-import argparse
-parser = argparse.ArgumentParser()
-parser.add_argument("--method", type=str, default="shape",
-                    help="分類方法名稱，decoraction / dynasty / glaze / kiln / shape")
-args = parser.parse_args()
-CLASSIFICATION_METHOD = args.method
-# =====================
 
 # ===== 手動設定 =====
 
-FEATURE_FILE = f"./features/{CLASSIFICATION_METHOD}/pca_features.npz"  # 使用 PCA 特徵
-OUTPUT_DIR = f"./visualize/{CLASSIFICATION_METHOD}"
 UMAP_N_NEIGHBORS = 200
 UMAP_MIN_DIST = 0.25
 UMAP_SPREAD = 1.5
@@ -27,8 +13,9 @@ MARKERS = ['o', 's', '^', 'v', 'D', 'P', 'X']
 
 # ===================
 
-def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+def main(method="shape"):
+    FEATURE_FILE = f"./features/{method}/pca_features.npz"  # 使用 PCA 特徵
+    OUTPUT_DIR = f"./visualize/{method}"
     SCATTER_FILE = os.path.join(OUTPUT_DIR, "umap_scatter.png")
     CENTROIDS_FILE = os.path.join(OUTPUT_DIR, "umap_centroids.png")
     CLASS_MAPPING_FILE = os.path.join(OUTPUT_DIR, "class_mapping.json")
@@ -36,6 +23,11 @@ def main():
     if not os.path.exists(FEATURE_FILE):
         print(f"❌ 找不到特徵檔：{FEATURE_FILE}")
         return
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    import matplotlib.pyplot as plt
+    import umap
+    from sklearn.preprocessing import LabelEncoder
 
     # 讀取 PCA 特徵
     data = np.load(FEATURE_FILE, allow_pickle=True)
@@ -75,7 +67,7 @@ def main():
         idx = y==i
         plt.scatter(X_umap[idx,0], X_umap[idx,1], c=[cmap(i%NUM_COLORS)], marker=MARKERS[i%len(MARKERS)],
                     s=30, alpha=0.7, label=i)
-    plt.title(f"UMAP Scatter ({CLASSIFICATION_METHOD})")
+    plt.title(f"UMAP Scatter ({method})")
     plt.xlabel("UMAP Dim 1")
     plt.ylabel("UMAP Dim 2")
     plt.grid(True, alpha=0.2)
@@ -95,7 +87,7 @@ def main():
                     ha='center', va='center')
     plt.xlim(X_umap[:,0].min()-0.5, X_umap[:,0].max()+0.5)
     plt.ylim(X_umap[:,1].min()-0.5, X_umap[:,1].max()+0.5)
-    plt.title(f"UMAP Centroids ({CLASSIFICATION_METHOD})")
+    plt.title(f"UMAP Centroids ({method})")
     plt.xlabel("UMAP Dim 1")
     plt.ylabel("UMAP Dim 2")
     plt.grid(True, alpha=0.2)
@@ -103,6 +95,3 @@ def main():
     plt.savefig(CENTROIDS_FILE, dpi=300, bbox_inches='tight')
     plt.close()
     print(f"✅ 中心點圖已儲存：{CENTROIDS_FILE}")
-
-if __name__ == "__main__":
-    main()
@@ -0,0 +1,22 @@
+# 共用設定：此模組不載入任何重量級套件，供 CLI 在解析參數時使用
+
+# ===== 手動設定 =====
+METHODS = ["decoration", "dynasty", "glaze", "kiln", "shape"]
+STORAGE_MODES = ["float32", "float16", "int8"]
+MODEL_NAME = "stabilityai/sd-vae-ft-mse"
+# ===================
+
+
+def get_device():
+    import torch
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def load_vae(model_name=MODEL_NAME, device=None):
+    """載入 VAE 並移到 device，回傳 (vae, device)"""
+    from diffusers import AutoencoderKL
+
+    device = device or get_device()
+    print(f"🧠 載入 VAE: {model_name} 到 {device} ...")
+    vae = AutoencoderKL.from_pretrained(model_name).to(device).eval()
+    return vae, device
@@ -0,0 +1,180 @@
+import os
+import json
+import time
+import numpy as np
+from PIL import Image
+from tqdm import tqdm
+from concurrent.futures import ThreadPoolExecutor
+
+# ===== 手動設定 =====
+IMAGE_DIR = "./picture"
+HASH_SIZE = 8          # pHash 取 8x8 低頻 DCT 係數 -> 64 bits
+IMG_SIZE = 32          # 先縮成 32x32 灰階再做 DCT
+HAMMING_THRESHOLD = 7  # 漢明距離 <= 此值視為近似重複
+NUM_WORKERS = os.cpu_count() or 4
+# ===================
+
+
+def load_gray(img_path):
+    """讀取圖片並縮成 IMG_SIZE x IMG_SIZE 灰階；JPEG 以 draft 模式直接低解析度解碼"""
+    try:
+        img = Image.open(img_path)
+        img.draft("L", (IMG_SIZE * 2, IMG_SIZE * 2))
+        img = img.convert("L").resize((IMG_SIZE, IMG_SIZE), Image.BILINEAR)
+        return np.asarray(img, dtype=np.float32)
+    except Exception as e:
+        print(f"⚠️ 無法處理圖片 {img_path}: {e}")
+        return None
+
+
+def dct_matrix(n):
+    """DCT-II 正交矩陣 (n, n)"""
+    k = np.arange(n)[:, None]
+    x = np.arange(n)[None, :]
+    mat = np.cos(np.pi * (2 * x + 1) * k / (2 * n)) * np.sqrt(2.0 / n)
+    mat[0] /= np.sqrt(2.0)
+    return mat
+
+
+def phash_bits(images):
+    """批次計算 pHash：images (N, IMG_SIZE, IMG_SIZE) -> bits (N, HASH_SIZE**2) bool"""
+    D = dct_matrix(IMG_SIZE)
+    coeffs = np.einsum("ij,njk,lk->nil", D, images, D)[:, :HASH_SIZE, :HASH_SIZE]
+    coeffs = coeffs.reshape(len(images), -1)
+    median = np.median(coeffs[:, 1:], axis=1, keepdims=True)  # 排除 DC 項
+    return coeffs > median
+
+
+def candidate_pairs(bits, threshold=HAMMING_THRESHOLD):
+    """
+    Multi-index hashing：將 hash 切成 threshold + 1 段，
+    漢明距離 <= threshold 的兩個 hash 至少有一段完全相同（鴿籠原理），
+    因此只需比較同一段落桶內的樣本，不必兩兩比較
+    """
+    n = bits.shape[0]
+    pairs = []
+    for band in np.array_split(np.arange(bits.shape[1]), threshold + 1):
+        weights = 1 << np.arange(len(band), dtype=np.int64)
+        keys = bits[:, band].astype(np.int64) @ weights
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        bounds = np.flatnonzero(np.diff(sorted_keys)) + 1
+        for bucket in np.split(order, bounds):
+            if len(bucket) < 2:
+                continue
+            i, j = np.triu_indices(len(bucket), k=1)
+            pairs.append(np.stack([bucket[i], bucket[j]], axis=1))
+    if not pairs:
+        return np.zeros((0, 2), dtype=np.int64)
+    pairs = np.sort(np.concatenate(pairs), axis=1)
+    codes = np.unique(pairs[:, 0] * n + pairs[:, 1])
+    return np.stack([codes // n, codes % n], axis=1)
+
+
+def find_root(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def main(method="shape"):
+    DATA_FILE = f"./data/{method}.json"
+    OUTPUT_FILE = f"./data/{method}_duplicates.json"  # ceramics extract --dedup 讀取
+
+    if not os.path.exists(DATA_FILE):
+        print(f"❌ 找不到資料檔：{DATA_FILE}")
+        return
+
+    with open(DATA_FILE, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    timings = {}
+
+    # 同一 identifier 可能出現在多個類別，只需讀取一次
+    t0 = time.perf_counter()
+    all_ids = [item["identifier"] for item in data if "class" in item and "identifier" in item]
+    unique_ids = [i for i in dict.fromkeys(all_ids)
+                  if os.path.exists(os.path.join(IMAGE_DIR, f"{i}.jpg"))]
+    paths = [os.path.join(IMAGE_DIR, f"{i}.jpg") for i in unique_ids]
+
+    print(f"🔍 以 {NUM_WORKERS} 個執行緒計算 {len(paths)} 張圖片的 pHash ...")
+    with ThreadPoolExecutor(max_workers=NUM_WORKERS) as pool:
+        arrays = list(tqdm(pool.map(load_gray, paths), total=len(paths), ncols=100))
+    valid = [k for k, a in enumerate(arrays) if a is not None]
+    unique_ids = [unique_ids[k] for k in valid]
+    images = np.stack([arrays[k] for k in valid]) if valid else np.zeros((0, IMG_SIZE, IMG_SIZE), np.float32)
+    timings["load"] = time.perf_counter() - t0
+
+    if len(unique_ids) < 2:
+        print("❌ 可比較的圖片不足兩張")
+        return
+
+    t0 = time.perf_counter()
+    bits = phash_bits(images)
+    timings["hash"] = time.perf_counter() - t0
+
+    # 候選配對 + 漢明距離驗證
+    t0 = time.perf_counter()
+    pairs = candidate_pairs(bits)
+    dist = (bits[pairs[:, 0]] != bits[pairs[:, 1]]).sum(axis=1)
+    keep = dist <= HAMMING_THRESHOLD
+    pairs, dist = pairs[keep], dist[keep]
+    timings["index"] = time.perf_counter() - t0
+
+    # === 同類別內的近似重複以 union-find 合併 ===
+    # 不同類別間的重複只回報不合併，避免刪除某類別的樣本
+    id_pos = {identifier: k for k, identifier in enumerate(unique_ids)}
+    entries = [(item["identifier"], item["class"]) for item in data
+               if "class" in item and item.get("identifier") in id_pos]
+    by_image = {}
+    for e, (identifier, _) in enumerate(entries):
+        by_image.setdefault(id_pos[identifier], []).append(e)
+
+    parent = list(range(len(entries)))
+    cross_class_pairs = []
+    for (a, b), d in zip(pairs.tolist(), dist.tolist()):
+        for ea in by_image[a]:
+            for eb in by_image[b]:
+                if entries[ea][1] == entries[eb][1]:
+                    ra, rb = find_root(parent, ea), find_root(parent, eb)
+                    if ra != rb:
+                        parent[max(ra, rb)] = min(ra, rb)  # 保留資料順序中最早的一筆
+                else:
+                    cross_class_pairs.append([entries[ea][0], entries[eb][0], int(d)])
+
+    groups = {}
+    for e in range(len(entries)):
+        groups.setdefault(find_root(parent, e), []).append(e)
+    duplicate_groups = []
+    skip = []
+    for root, members in sorted(groups.items()):
+        if len(members) < 2:
+            continue
+        duplicate_groups.append({
+            "class": entries[root][1],
+            "keep": entries[root][0],
+            "duplicates": [entries[e][0] for e in members if e != root],
+        })
+        skip.extend([entries[e][0], entries[e][1]] for e in members if e != root)
+
+    report = {
+        "method": method,
+        "n_images": len(unique_ids),
+        "hamming_threshold": HAMMING_THRESHOLD,
+        "n_candidate_pairs": int(keep.size),
+        "n_duplicate_pairs": int(pairs.shape[0]),
+        "n_skipped": len(skip),
+        "skip": skip,
+        "groups": duplicate_groups,
+        "cross_class_pairs": cross_class_pairs,
+        "timings_sec": {k: round(v, 6) for k, v in timings.items()},
+    }
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"🧮 候選配對 {keep.size} 組（全配對需 {len(unique_ids) * (len(unique_ids) - 1) // 2} 組）")
+    print(f"🧹 {len(duplicate_groups)} 組近似重複，可略過 {len(skip)} 次 VAE 編碼；跨類別重複 {len(cross_class_pairs)} 組")
+    print(f"✅ 重複圖片報告已儲存：{OUTPUT_FILE}")
+    for stage, sec in timings.items():
+        print(f"⏱️ {stage}: {sec:.3f}s")
@@ -1,22 +1,13 @@
 import os
 import json
-import requests
 from tqdm import tqdm
 
-# ===== args =====
-import argparse
-parser = argparse.ArgumentParser()
-parser.add_argument("--method", type=str, default="shape",
-                    help="分類方法名稱，decoraction / dynasty / glaze / kiln / shape")
-args = parser.parse_args()
-CLASSIFICATION_METHOD = args.method
-# =====================
-
-INPUT_FILE = f"./data/{CLASSIFICATION_METHOD}.json"
 OUTPUT_DIR = "./picture"
 
 def download_image(url, save_path):
     """下載圖片並儲存"""
+    import requests
+
     try:
         response = requests.get(url, timeout=10)
         response.raise_for_status()
@@ -27,7 +18,11 @@ def download_image(url, save_path):
         print(f"❌ 無法下載 {url}: {e}")
         return False
 
-def main():
+def main(method="shape"):
+    INPUT_FILE = f"./data/{method}.json"
+    if not os.path.exists(INPUT_FILE):
+        print(f"❌ 找不到資料檔：{INPUT_FILE}")
+        return
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     with open(INPUT_FILE, "r", encoding="utf-8") as f:
@@ -49,6 +44,3 @@ def main():
         download_image(img_url, save_path)
 
     print("✅ 下載完成，圖片已儲存至 ./picture/")
-
-if __name__ == "__main__":
-    main()
@@ -0,0 +1,195 @@
+import os
+import json
+import time
+import numpy as np
+from PIL import Image
+from tqdm import tqdm
+from .common import MODEL_NAME, load_vae
+from .latent_store import quantize_features
+
+# ===== 手動設定 =====
+IMAGE_DIR = "./picture"
+STATS_BLOCK_SIZE = 256
+PCA_COMPONENTS = 50
+RANDOM_STATE = 42
+# ===================
+
+def get_transform():
+    from torchvision import transforms
+
+    return transforms.Compose([
+        transforms.Resize((512, 512)),
+        transforms.ToTensor(),
+        transforms.Normalize([0.5, 0.5, 0.5], [0.5, 0.5, 0.5])  # to [-1,1]
+    ])
+
+def extract_feature(img_path, model, transform, device):
+    import torch
+
+    try:
+        img = Image.open(img_path).convert("RGB")
+        tensor = transform(img).unsqueeze(0).to(device)
+        with torch.no_grad():
+            enc = model.encode(tensor)
+            latent = enc.latent_dist.mean
+            feat = latent.cpu().numpy().reshape(-1)
+        return feat
+    except Exception as e:
+        print(f"⚠️ 無法處理圖片 {img_path}: {e}")
+        return None
+
+def compute_class_stats(features, labels, class_names, block_size=STATS_BLOCK_SIZE):
+    """
+    以 one-hot 矩陣乘法分塊累加各類別的樣本數、總和與平方和（單次掃描）
+    並由總和推得全域 std，供 meanobject / pca_grid / pca_animation 使用
+    """
+    class_index = {c: i for i, c in enumerate(class_names)}
+    y = np.array([class_index[l] for l in labels])
+    num_classes, dim = len(class_names), features.shape[1]
+
+    counts = np.bincount(y, minlength=num_classes).astype(np.int64)
+    sums = np.zeros((num_classes, dim), dtype=np.float64)
+    sumsq = np.zeros((num_classes, dim), dtype=np.float64)
+    for start in range(0, features.shape[0], block_size):
+        block = features[start:start + block_size].astype(np.float64)
+        yb = y[start:start + block_size]
+        onehot = np.zeros((block.shape[0], num_classes), dtype=np.float64)
+        onehot[np.arange(block.shape[0]), yb] = 1
+        sums += onehot.T @ block
+        sumsq += onehot.T @ (block * block)
+
+    # 與 features.std(axis=0).mean() 相同（ddof=0）
+    n = counts.sum()
+    total_mean = sums.sum(axis=0) / n
+    total_var = np.maximum(sumsq.sum(axis=0) / n - total_mean ** 2, 0.0)
+    global_std = np.sqrt(total_var).mean()
+    return counts, sums, sumsq, global_std
+
+def main(method="shape", dedup=False, storage="float32"):
+    DATA_FILE = f"./data/{method}.json"
+    DUPLICATE_FILE = f"./data/{method}_duplicates.json"
+    OUT_DIR = f"./features/{method}"
+    OUT_FILE = os.path.join(OUT_DIR, "features.npz")
+    PCA_FILE = os.path.join(OUT_DIR, "pca_features.npz")
+    STATS_FILE = os.path.join(OUT_DIR, "class_stats.npz")
+
+    if not os.path.exists(DATA_FILE):
+        print(f"❌ 找不到資料檔：{DATA_FILE}")
+        return
+    os.makedirs(OUT_DIR, exist_ok=True)
+
+    with open(DATA_FILE, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    skip = set()
+    if dedup:
+        if os.path.exists(DUPLICATE_FILE):
+            with open(DUPLICATE_FILE, "r", encoding="utf-8") as f:
+                skip = {tuple(entry) for entry in json.load(f)["skip"]}
+            print(f"🧹 依 {DUPLICATE_FILE} 略過 {len(skip)} 筆近似重複")
+        else:
+            print(f"⚠️ 找不到重複圖片報告：{DUPLICATE_FILE}，請先執行 python -m ceramics dedup")
+
+    vae, device = load_vae(MODEL_NAME)
+    transform = get_transform()
+
+    features, labels, ids, missing = [], [], [], []
+    feat_cache = {}  # 同一張圖片出現在多個類別時只編碼一次
+    encode_time, n_encoded, n_skipped, n_cached = 0.0, 0, 0, 0
+
+    print(f"📦 開始從 {IMAGE_DIR} 抽取特徵，共 {len(data)} 項...")
+    for item in tqdm(data):
+        if "class" not in item:
+            missing.append(item.get("identifier", "N/A"))
+            continue
+
+        img_path = os.path.join(IMAGE_DIR, f"{item['identifier']}.jpg")
+        if not os.path.exists(img_path):
+            missing.append(item.get("identifier", "N/A"))
+            continue
+
+        if (item["identifier"], item["class"]) in skip:
+            n_skipped += 1
+            continue
+
+        if img_path in feat_cache:
+            feat = feat_cache[img_path]
+            n_cached += 1
+        else:
+            t0 = time.perf_counter()
+            feat = extract_feature(img_path, vae, transform, device)
+            encode_time += time.perf_counter() - t0
+            n_encoded += 1
+            feat_cache[img_path] = feat
+        if feat is not None:
+            features.append(feat)
+            labels.append(item["class"])
+            ids.append(item["identifier"])
+        else:
+            missing.append(item.get("identifier", "N/A"))
+
+    if n_encoded and (n_skipped or n_cached):
+        per_image = encode_time / n_encoded
+        print(f"⏱️ 編碼 {n_encoded} 張，平均 {per_image:.3f}s/張；"
+              f"略過重複 {n_skipped} 張、重用快取 {n_cached} 張，"
+              f"約節省 {(n_skipped + n_cached) * per_image:.1f}s")
+
+    if not features:
+        print("❌ 未抽取到任何特徵，請確認圖片存在並可讀取。")
+        return
+
+    features = np.stack(features, axis=0)  # (N, D)
+    class_names = sorted(list(set(labels)))
+
+    # === 儲存原始特徵 ===
+    # PCA 與類別統計量皆以記憶體中的 float32 計算，量化只影響 features.npz
+    np.savez_compressed(
+        OUT_FILE,
+        **quantize_features(features, storage),
+        labels=np.array(labels, dtype=object),
+        ids=np.array(ids, dtype=object),
+        class_names=np.array(class_names, dtype=object)
+    )
+    print(f"✅ 原始特徵已儲存：{OUT_FILE} ({storage})")
+
+    # === 儲存各類別統計量 (sidecar) ===
+    counts, sums, sumsq, global_std = compute_class_stats(features, labels, class_names)
+    np.savez_compressed(
+        STATS_FILE,
+        class_names=np.array(class_names, dtype=object),
+        counts=counts,
+        sums=sums,
+        sumsq=sumsq,
+        global_std=np.float64(global_std)
+    )
+    print(f"✅ 類別統計量已儲存：{STATS_FILE}")
+
+    # === 標準化 + PCA 降維 ===
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.decomposition import PCA
+
+    print("⚙️ 執行標準化 (StandardScaler) ...")
+    scaler = StandardScaler()
+    Xs = scaler.fit_transform(features)
+
+    pca_components = min(PCA_COMPONENTS, Xs.shape[1])
+    print(f"⚙️ 執行 PCA -> {pca_components} components ...")
+    pca = PCA(n_components=pca_components, random_state=RANDOM_STATE)
+    X_pca = pca.fit_transform(Xs)
+
+    np.save(os.path.join(OUT_DIR, "pca_components.npy"), pca.components_)
+    np.savez_compressed(
+        PCA_FILE,
+        features=X_pca,
+        labels=np.array(labels, dtype=object),
+        ids=np.array(ids, dtype=object),
+        class_names=np.array(class_names, dtype=object)
+    )
+    np.save(os.path.join(OUT_DIR, "scaler_mean.npy"), scaler.mean_)
+    np.save(os.path.join(OUT_DIR, "scaler_scale.npy"), scaler.scale_)
+
+    print(f"✅ PCA 特徵已儲存：{PCA_FILE}")
+
+    if missing:
+        print(f"⚠️ 有 {len(missing)} 張圖片缺失或無法處理：")
+        print(missing[:50])
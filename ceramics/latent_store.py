@@ -0,0 +1,56 @@
+import numpy as np
+from .common import STORAGE_MODES
+
+# ===== 手動設定 =====
+LATENT_SHAPE = (4, 64, 64)  # VAE latent: 4 channels x 64 x 64
+# ===================
+
+
+def quantize_features(features, mode="float32"):
+    """
+    將原始 latent (N, D) 轉成儲存格式，回傳可直接傳給 np.savez_compressed 的 dict
+    - float32: 原樣儲存
+    - float16: 半精度
+    - int8: 每張圖片、每個 latent channel 各自以 min/max 線性量化，附 scale / offset
+    """
+    if mode not in STORAGE_MODES:
+        raise ValueError(f"未知的儲存格式：{mode}，可選 {STORAGE_MODES}")
+
+    features = np.asarray(features, dtype=np.float32)
+    if mode == "float32":
+        return {"features": features, "features_storage": np.array(mode)}
+    if mode == "float16":
+        return {"features": features.astype(np.float16), "features_storage": np.array(mode)}
+
+    n = features.shape[0]
+    x = features.reshape(n, LATENT_SHAPE[0], -1)
+    lo = x.min(axis=2, keepdims=True)
+    hi = x.max(axis=2, keepdims=True)
+    scale = np.maximum(hi - lo, 1e-12) / 255.0
+    q = np.rint((x - lo) / scale) - 128
+    return {
+        "features": q.astype(np.int8).reshape(n, -1),
+        "features_storage": np.array(mode),
+        "features_scale": scale[..., 0].astype(np.float32),   # (N, C)
+        "features_offset": lo[..., 0].astype(np.float32),     # (N, C)
+    }
+
+
+def dequantize_features(data):
+    """由 np.load 的結果（或 quantize_features 的輸出）還原 float32 latent (N, D)"""
+    mode = str(data["features_storage"]) if "features_storage" in data else "float32"
+    q = data["features"]
+    if mode != "int8":
+        return q.astype(np.float32)
+
+    n = q.shape[0]
+    scale = data["features_scale"][:, :, None]
+    offset = data["features_offset"][:, :, None]
+    x = (q.reshape(n, scale.shape[1], -1).astype(np.float32) + 128) * scale + offset
+    return x.reshape(n, -1)
+
+
+def load_features(path):
+    """讀取 features.npz，回傳 (float32 features, npz data)"""
+    data = np.load(path, allow_pickle=True)
+    return dequantize_features(data), data
@@ -0,0 +1,71 @@
+import os
+import numpy as np
+from PIL import Image, ImageEnhance
+from .common import MODEL_NAME, load_vae
+
+def decode_latent(latent, vae, device):
+    """將 latent vector decode 成圖片"""
+    import torch
+
+    latent = torch.from_numpy(latent).float().to(device)
+    latent = latent.view(1, 4, 64, 64)
+    with torch.no_grad():
+        img = vae.decode(latent).sample
+        # 將 [-1,1] 轉回 [0,255]
+        img = ((img / 2 + 0.5).clamp(0, 1) * 255).cpu().numpy()
+        img = img[0].transpose(1, 2, 0).astype(np.uint8)
+        pil_img = Image.fromarray(img)
+
+        # 增加對比度 (Contrast)
+        enhancer_contrast = ImageEnhance.Contrast(pil_img)
+        pil_img = enhancer_contrast.enhance(2.0)
+
+        # 增加銳利度 (Sharpness)
+        enhancer_sharpness = ImageEnhance.Sharpness(pil_img)
+        pil_img = enhancer_sharpness.enhance(5.0)
+
+    return pil_img
+
+
+def main(method="shape"):
+    STATS_FILE = f"./features/{method}/class_stats.npz"  # ceramics/extract.py 產生的類別統計量
+    OUTPUT_DIR = f"./visualize/{method}/mean_object"
+
+    # 載入類別統計量（大小與樣本數無關）
+    if not os.path.exists(STATS_FILE):
+        print(f"❌ 找不到類別統計檔：{STATS_FILE}，請重新執行 python -m ceramics extract")
+        return
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    # 載入 VAE
+    vae, device = load_vae(MODEL_NAME)
+
+    stats = np.load(STATS_FILE, allow_pickle=True)
+    counts = stats['counts']          # shape: [C]
+    sums = stats['sums']              # shape: [C, D]
+    class_names = stats['class_names'] # array of strings
+
+    print(f"✅ 載入類別統計量: {len(class_names)} classes, {counts.sum()} samples")
+
+    for class_name, count, class_sum in zip(class_names, counts, sums):
+        if count == 0:
+            print(f"⚠️ 類別 {class_name} 沒有資料，跳過")
+            continue
+
+        mean_object = class_sum / count
+
+        # # 儲存 mean object .npy
+        # out_npy = os.path.join(OUTPUT_DIR, f"{class_name}.npy")
+        # np.save(out_npy, mean_object)
+        # print(f"✅ 儲存 Mean Object NPY: {out_npy}, 樣本數: {count}")
+
+        # Decode 成圖片並存 PNG
+        try:
+            img = decode_latent(mean_object, vae, device)
+            out_png = os.path.join(OUTPUT_DIR, f"{class_name}.png")
+            img.save(out_png)
+            print(f"✅ 儲存 Mean Object PNG: {out_png}")
+        except Exception as e:
+            print(f"⚠️ 解碼類別 {class_name} 失敗: {e}")
+
+    print("🎉 全部 Mean Object 已完成計算與儲存")
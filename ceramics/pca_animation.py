@@ -0,0 +1,158 @@
+import os
+import queue
+import threading
+import numpy as np
+from PIL import Image
+from .common import MODEL_NAME, load_vae
+from .pca_grid import enhance_image, pca_directions
+
+# ===== 手動設定 =====
+NUM_FRAMES = 60
+FPS = 15
+BATCH_SIZE = 8       # 每次解碼的 frame 數
+QUEUE_BATCHES = 2    # 解碼與編碼之間最多暫存的 batch 數，限制記憶體用量
+RADIUS = 2           # 走訪半徑（單位：pca_grid.GRID_STEP 步），與 4x4 grid 的範圍相同
+# (codec, pixel format, ffmpeg output params)
+# GIF 每個 frame 各自以 palettegen 建立 256 色調色盤，避免 swscale 固定 3-3-2 調色盤造成色階斷層；
+# stats_mode=single 逐 frame 輸出調色盤，ffmpeg 不需暫存整段動畫
+CODECS = {
+    "gif": ("gif", "pal8", ["-vf", "split[a][b];[a]palettegen=stats_mode=single[p];[b][p]paletteuse=new=1"]),
+    "mp4": ("libx264", "yuv420p", None),
+}
+# =====================
+
+
+def decode_batch(latents, vae, device):
+    """Decode a batch of latents (B, D) into uint8 frames (B, H, W, 3)."""
+    import torch
+
+    latent = torch.from_numpy(latents).float().to(device)
+    latent = latent.view(-1, 4, 64, 64)
+    with torch.no_grad():
+        img = vae.decode(latent).sample
+        img = ((img / 2 + 0.5).clamp(0, 1) * 255).cpu().numpy()
+    img = img.transpose(0, 2, 3, 1).astype(np.uint8)
+
+    return [np.asarray(enhance_image(Image.fromarray(frame))) for frame in img]
+
+
+def latent_path(mean_latent, direction_a, direction_b, scale_factor):
+    """沿兩個 PCA 方向繞一圈的封閉路徑，逐 batch 產生 latent (B, D)，首尾相接可循環播放"""
+    for start in range(0, NUM_FRAMES, BATCH_SIZE):
+        t = 2 * np.pi * np.arange(start, min(start + BATCH_SIZE, NUM_FRAMES)) / NUM_FRAMES
+        offset_a = (RADIUS * scale_factor * np.cos(t))[:, None]
+        offset_b = (RADIUS * scale_factor * np.sin(t))[:, None]
+        yield mean_latent[None, :] + offset_a * direction_a[None, :] + offset_b * direction_b[None, :]
+
+
+def put_unless_stopped(frame_queue, item, stop):
+    """queue 滿時每隔一段時間檢查 stop，避免編碼端中止後背景執行緒永遠卡在 put"""
+    while not stop.is_set():
+        try:
+            frame_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def decode_worker(batches, vae, device, frame_queue, stop):
+    """背景執行緒：逐 batch 解碼並放入 queue，queue 滿時暫停，讓解碼與編碼重疊進行"""
+    try:
+        for latents in batches:
+            if stop.is_set() or not put_unless_stopped(frame_queue, decode_batch(latents, vae, device), stop):
+                return
+    except Exception as e:
+        put_unless_stopped(frame_queue, e, stop)
+    finally:
+        put_unless_stopped(frame_queue, None, stop)
+
+
+def render_animation(out_path, batches, vae, device, fmt="gif"):
+    import imageio_ffmpeg
+
+    frame_queue = queue.Queue(maxsize=QUEUE_BATCHES)
+    stop = threading.Event()
+    worker = threading.Thread(target=decode_worker, args=(batches, vae, device, frame_queue, stop), daemon=True)
+    worker.start()
+
+    # 以 ffmpeg 串流寫入，frame 寫入後即可釋放
+    codec, pix_fmt, output_params = CODECS[fmt]
+    writer = None
+    try:
+        while True:
+            frames = frame_queue.get()
+            if frames is None:
+                break
+            if isinstance(frames, Exception):
+                raise frames
+            for frame in frames:
+                if writer is None:
+                    h, w = frame.shape[:2]
+                    writer = imageio_ffmpeg.write_frames(out_path, (w, h), fps=FPS, codec=codec,
+                                                         pix_fmt_out=pix_fmt, macro_block_size=1,
+                                                         output_params=output_params)
+                    writer.send(None)  # 啟動 generator
+                writer.send(frame)
+    finally:
+        # 通知背景執行緒停止並清空 queue，確保它釋放 VAE 與暫存的 frame 後結束
+        stop.set()
+        while True:
+            try:
+                frame_queue.get_nowait()
+            except queue.Empty:
+                break
+        worker.join()
+        if writer is not None:
+            writer.close()
+
+
+def main(method="shape", components=(0, 1), fmt="gif"):
+    OUTPUT_DIR = f"./visualize/{method}/pca_animation"
+    STATS_FILE = f"./features/{method}/class_stats.npz"
+    PCA_COMPONENT_FILE = f"./features/{method}/pca_components.npy"
+    SCALER_SCALE_FILE = f"./features/{method}/scaler_scale.npy"
+    comp_a, comp_b = components
+
+    if min(comp_a, comp_b) < 0:
+        print(f"❌ PCA component must be non-negative: {comp_a}, {comp_b}")
+        return
+    if comp_a == comp_b:
+        print(f"❌ Two different PCA components are required: {comp_a}, {comp_b}")
+        return
+
+    for path in (STATS_FILE, PCA_COMPONENT_FILE, SCALER_SCALE_FILE):
+        if not os.path.exists(path):
+            print(f"❌ Input not found: {path}, please re-run python -m ceramics extract")
+            return
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    # === Load data ===
+    stats = np.load(STATS_FILE, allow_pickle=True)
+    pca_components = np.load(PCA_COMPONENT_FILE)
+    scaler_scale = np.load(SCALER_SCALE_FILE)
+
+    if max(comp_a, comp_b) >= pca_components.shape[0]:
+        print(f"❌ PCA component out of range: only {pca_components.shape[0]} components")
+        return
+
+    vae, device = load_vae(MODEL_NAME)
+
+    class_names = stats["class_names"].astype(str)
+    counts = stats["counts"]
+    sums = stats["sums"]
+
+    pca_components_orig, scale_factor = pca_directions(stats, pca_components, scaler_scale)
+
+    print(f"📏 scale_factor = {scale_factor:.6f}")
+
+    for class_name, count, class_sum in zip(class_names, counts, sums):
+        if count == 0:
+            continue
+
+        mean_latent = class_sum / count
+        batches = latent_path(mean_latent, pca_components_orig[comp_a], pca_components_orig[comp_b], scale_factor)
+
+        out_path = os.path.join(OUTPUT_DIR, f"{class_name}_pc{comp_a}_pc{comp_b}.{fmt}")
+        render_animation(out_path, batches, vae, device, fmt)
+        print(f"✅ Saved PCA animation: {out_path}")
@@ -0,0 +1,103 @@
+import os
+import numpy as np
+from PIL import Image, ImageEnhance
+from .common import MODEL_NAME, load_vae
+
+# ===== 手動設定 =====
+GRID_SIZE = 4
+GRID_STEP = 20  # 調整 PCA 步進距離
+# =====================
+
+
+def enhance_image(pil_img):
+    """PCA grid / 動畫共用的對比度與銳利度增強"""
+    # 增加對比度 (Contrast)
+    enhancer_contrast = ImageEnhance.Contrast(pil_img)
+    pil_img = enhancer_contrast.enhance(1.2)
+
+    # 增加銳利度 (Sharpness)
+    enhancer_sharpness = ImageEnhance.Sharpness(pil_img)
+    return enhancer_sharpness.enhance(5.0)
+
+
+def pca_directions(stats, pca_components, scaler_scale):
+    """將 PCA 方向轉回原始 latent 空間，並以全域 std 決定每一步的距離；回傳 (directions, scale_factor)"""
+    # === Convert PCA directions back to original latent space ===
+    pca_components_orig = pca_components * scaler_scale[np.newaxis, :]
+
+    # === Step size control ===
+    latent_std = float(stats["global_std"])
+    scale_factor = latent_std * GRID_STEP
+    return pca_components_orig, scale_factor
+
+
+def decode_latent(latent, vae, device):
+    """Decode latent tensor back to image."""
+    import torch
+
+    latent = torch.from_numpy(latent).float().unsqueeze(0).to(device)
+    latent = latent.view(1, 4, 64, 64)
+    with torch.no_grad():
+        img = vae.decode(latent).sample
+        img = ((img / 2 + 0.5).clamp(0, 1) * 255).cpu().numpy()
+        img = img[0].transpose(1, 2, 0).astype(np.uint8)
+        pil_img = enhance_image(Image.fromarray(img))
+
+    return pil_img
+
+
+def main(method="shape"):
+    OUTPUT_DIR = f"./visualize/{method}/pca_grid"
+    STATS_FILE = f"./features/{method}/class_stats.npz"
+    PCA_COMPONENT_FILE = f"./features/{method}/pca_components.npy"
+    SCALER_SCALE_FILE = f"./features/{method}/scaler_scale.npy"
+
+    for path in (STATS_FILE, PCA_COMPONENT_FILE, SCALER_SCALE_FILE):
+        if not os.path.exists(path):
+            print(f"❌ Input not found: {path}, please re-run python -m ceramics extract")
+            return
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    # === Load data ===
+    stats = np.load(STATS_FILE, allow_pickle=True)
+    pca_components = np.load(PCA_COMPONENT_FILE)
+    scaler_scale = np.load(SCALER_SCALE_FILE)
+
+    vae, device = load_vae(MODEL_NAME)
+
+    class_names = stats["class_names"].astype(str)
+    counts = stats["counts"]
+    sums = stats["sums"]
+
+    pca_components_orig, scale_factor = pca_directions(stats, pca_components, scaler_scale)
+
+    print(f"📏 scale_factor = {scale_factor:.6f}")
+
+    for class_name, count, class_sum in zip(class_names, counts, sums):
+        if count == 0:
+            continue
+
+        mean_latent = class_sum / count
+        imgs = []
+
+        for i in range(GRID_SIZE):
+            for j in range(GRID_SIZE):
+                # X 軸: PCA #1, Y 軸: PCA #2
+                scale_i = (i - GRID_SIZE // 2) * scale_factor
+                scale_j = (j - GRID_SIZE // 2) * scale_factor
+                latent = mean_latent.copy()
+                latent += scale_i * pca_components_orig[0] + scale_j * pca_components_orig[1]
+                img = decode_latent(latent, vae, device)
+                imgs.append(img)
+
+        # === 合併成 grid ===
+        w, h = imgs[0].size
+        grid_img = Image.new("RGB", (w * GRID_SIZE, h * GRID_SIZE))
+        for idx, img in enumerate(imgs):
+            x = (idx % GRID_SIZE) * w
+            y = (idx // GRID_SIZE) * h
+            grid_img.paste(img, (x, y))
+
+        out_path = os.path.join(OUTPUT_DIR, f"{class_name}.png")
+        grid_img.save(out_path)
+        print(f"✅ Saved PCA grid: {out_path}")
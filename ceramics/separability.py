@@ -0,0 +1,175 @@
+import os
+import csv
+import json
+import time
+import numpy as np
+
+# ===== 手動設定 =====
+METRIC = "euclidean"   # euclidean / cosine
+KNN_K = 10
+BLOCK_SIZE = 1024      # 每次計算 BLOCK_SIZE x N 的距離矩陣，控制記憶體用量
+# ===================
+
+
+def class_statistics(X, y, num_classes):
+    """以 one-hot 矩陣乘法計算各類別的樣本數、平均與共變異數"""
+    onehot = np.zeros((X.shape[0], num_classes), dtype=X.dtype)
+    onehot[np.arange(X.shape[0]), y] = 1
+    counts = onehot.sum(axis=0)
+    means = (onehot.T @ X) / counts[:, None]
+
+    covs = np.zeros((num_classes, X.shape[1], X.shape[1]), dtype=X.dtype)
+    for i in range(num_classes):
+        Xc = X[y == i] - means[i]
+        if Xc.shape[0] > 1:
+            covs[i] = (Xc.T @ Xc) / (Xc.shape[0] - 1)
+    return counts.astype(np.int64), means, covs
+
+
+def pairwise_distances(A, B, metric=METRIC):
+    """計算 A (n, d) 與 B (m, d) 之間的距離矩陣 (n, m)"""
+    if metric == "cosine":
+        A = A / np.linalg.norm(A, axis=1, keepdims=True).clip(min=1e-12)
+        B = B / np.linalg.norm(B, axis=1, keepdims=True).clip(min=1e-12)
+        return np.clip(1.0 - A @ B.T, 0.0, 2.0)
+    sq = (A ** 2).sum(axis=1)[:, None] + (B ** 2).sum(axis=1)[None, :] - 2.0 * (A @ B.T)
+    return np.sqrt(np.maximum(sq, 0.0))
+
+
+def silhouette_and_knn(X, y, counts, k=KNN_K, block_size=BLOCK_SIZE):
+    """
+    分塊計算每個樣本的 silhouette 與 kNN 同類比例：
+    - 每塊只保留 (block_size, N) 的距離矩陣
+    - 各類別距離總和以矩陣乘法取得，無逐樣本 Python 迴圈
+    - 少於兩個類別時 silhouette 無定義（sklearn 會拒絕計算），回傳 None
+    """
+    n = X.shape[0]
+    num_classes = len(counts)
+    k = min(k, n - 1)
+    onehot = np.zeros((n, num_classes), dtype=X.dtype)
+    onehot[np.arange(n), y] = 1
+
+    has_silhouette = num_classes >= 2
+    silhouette = np.zeros(n, dtype=np.float64) if has_silhouette else None
+    knn_agree = np.zeros(n, dtype=np.float64)
+
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        rows = np.arange(start, stop)
+        yb = y[start:stop]
+        dist = pairwise_distances(X[start:stop], X)
+
+        # === silhouette ===
+        if has_silhouette:
+            class_sums = dist @ onehot  # (B, C)，自身距離為 0 不影響總和
+            own_counts = counts[yb]
+            a = class_sums[np.arange(len(rows)), yb] / np.maximum(own_counts - 1, 1)
+            mean_other = class_sums / np.maximum(counts, 1)[None, :]
+            mean_other[np.arange(len(rows)), yb] = np.inf
+            b = mean_other.min(axis=1)
+            s = (b - a) / np.maximum(np.maximum(a, b), 1e-12)
+            s[own_counts <= 1] = 0.0  # 與 sklearn 相同：單一樣本類別 silhouette 為 0
+            silhouette[start:stop] = s
+
+        # === kNN 同類比例 ===
+        if k > 0:
+            dist[np.arange(len(rows)), rows] = np.inf  # 排除自身
+            nn = np.argpartition(dist, k - 1, axis=1)[:, :k]
+            knn_agree[start:stop] = (y[nn] == yb[:, None]).mean(axis=1)
+
+    return silhouette, knn_agree
+
+
+def main(method="shape"):
+    FEATURE_FILE = f"./features/{method}/pca_features.npz"  # 使用 PCA 特徵
+    OUTPUT_DIR = f"./visualize/{method}"
+    REPORT_FILE = os.path.join(OUTPUT_DIR, "separability.json")
+    DISTANCE_FILE = os.path.join(OUTPUT_DIR, "centroid_distances.csv")
+    STATS_FILE = os.path.join(OUTPUT_DIR, "separability_stats.npz")
+
+    if not os.path.exists(FEATURE_FILE):
+        print(f"❌ 找不到特徵檔：{FEATURE_FILE}")
+        return
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    timings = {}
+
+    # 讀取 PCA 特徵
+    t0 = time.perf_counter()
+    data = np.load(FEATURE_FILE, allow_pickle=True)
+    X = data['features'].astype(np.float64)
+    labels = data['labels'].astype(str)
+    # 與 cluster.py 的 LabelEncoder 相同：依字典序編號，對應 class_mapping.json
+    class_names, y = np.unique(labels, return_inverse=True)
+    num_classes = len(class_names)
+    timings["load"] = time.perf_counter() - t0
+
+    print(f"📥 載入 PCA 特徵: {X.shape[0]} samples, {X.shape[1]} dims, {num_classes} classes")
+
+    # 類別平均與共變異數
+    t0 = time.perf_counter()
+    counts, means, covs = class_statistics(X, y, num_classes)
+    timings["class_statistics"] = time.perf_counter() - t0
+
+    # 群中心距離矩陣
+    t0 = time.perf_counter()
+    centroid_dist = pairwise_distances(means, means)
+    np.fill_diagonal(centroid_dist, 0.0)
+    timings["centroid_distances"] = time.perf_counter() - t0
+
+    # silhouette 與 kNN
+    t0 = time.perf_counter()
+    silhouette, knn_agree = silhouette_and_knn(X, y, counts)
+    timings["silhouette_knn"] = time.perf_counter() - t0
+    if silhouette is None:
+        print(f"⚠️ 只有 {num_classes} 個類別，silhouette 無定義，報告中記為 null")
+    print("✅ 可分性統計完成")
+
+    nearest = centroid_dist + np.diag(np.full(num_classes, np.inf))
+    per_class = {}
+    for i, c in enumerate(class_names):
+        j = int(nearest[i].argmin()) if num_classes > 1 else i
+        per_class[c] = {
+            "index": i,
+            "count": int(counts[i]),
+            "total_variance": float(np.trace(covs[i])),
+            "silhouette": float(silhouette[y == i].mean()) if silhouette is not None else None,
+            "knn_agreement": float(knn_agree[y == i].mean()),
+            "nearest_class": str(class_names[j]),
+            "nearest_centroid_distance": float(centroid_dist[i, j]),
+        }
+
+    report = {
+        "method": method,
+        "n_samples": int(X.shape[0]),
+        "n_dims": int(X.shape[1]),
+        "n_classes": int(num_classes),
+        "metric": METRIC,
+        "knn_k": int(min(KNN_K, X.shape[0] - 1)),
+        "silhouette": float(silhouette.mean()) if silhouette is not None else None,
+        "knn_agreement": float(knn_agree.mean()),
+        "classes": per_class,
+        "timings_sec": {k: round(v, 6) for k, v in timings.items()},
+    }
+    with open(REPORT_FILE, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=4, allow_nan=False)
+    print(f"✅ 可分性報告已儲存：{REPORT_FILE}")
+
+    with open(DISTANCE_FILE, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["class"] + list(class_names))
+        for i, c in enumerate(class_names):
+            writer.writerow([c] + [f"{d:.6f}" for d in centroid_dist[i]])
+    print(f"✅ 群中心距離矩陣已儲存：{DISTANCE_FILE}")
+
+    np.savez_compressed(
+        STATS_FILE,
+        class_names=np.array(class_names, dtype=object),
+        counts=counts,
+        means=means,
+        covariances=covs
+    )
+    print(f"✅ 類別平均與共變異數已儲存：{STATS_FILE}")
+
+    for stage, sec in timings.items():
+        print(f"⏱️ {stage}: {sec:.3f}s")
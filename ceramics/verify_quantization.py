@@ -0,0 +1,136 @@
+import os
+import io
+import json
+import numpy as np
+from .common import STORAGE_MODES, load_vae
+from .latent_store import quantize_features, dequantize_features, load_features
+
+# ===== 手動設定 =====
+BLOCK_SIZE = 256
+# ===================
+
+
+def compressed_size(arrays):
+    """以 savez_compressed 寫入記憶體，回傳檔案位元組數"""
+    buf = io.BytesIO()
+    np.savez_compressed(buf, **arrays)
+    return buf.tell()
+
+
+def load_decoder():
+    """回傳將 latent (K, D) 解碼成 [0,1] 影像 (K, H, W, 3) 的函式；只在 --decode 時載入 torch / diffusers"""
+    import torch
+
+    vae, device = load_vae()
+
+    def decode_images(latents):
+        imgs = []
+        with torch.no_grad():
+            for latent in latents:
+                z = torch.from_numpy(latent).float().view(1, 4, 64, 64).to(device)
+                img = (vae.decode(z).sample / 2 + 0.5).clamp(0, 1)
+                imgs.append(img[0].permute(1, 2, 0).cpu().numpy())
+        return np.stack(imgs)
+
+    return decode_images
+
+
+def main(method="shape", decode=False):
+    FEATURE_DIR = f"./features/{method}"
+    FEATURE_FILE = os.path.join(FEATURE_DIR, "features.npz")
+    PCA_COMPONENT_FILE = os.path.join(FEATURE_DIR, "pca_components.npy")
+    SCALER_MEAN_FILE = os.path.join(FEATURE_DIR, "scaler_mean.npy")
+    SCALER_SCALE_FILE = os.path.join(FEATURE_DIR, "scaler_scale.npy")
+    REPORT_FILE = os.path.join(FEATURE_DIR, "quantization_report.json")
+
+    for path in (FEATURE_FILE, PCA_COMPONENT_FILE, SCALER_MEAN_FILE, SCALER_SCALE_FILE):
+        if not os.path.exists(path):
+            print(f"❌ 找不到特徵檔：{path}")
+            return
+
+    reference, data = load_features(FEATURE_FILE)
+    stored = str(data["features_storage"]) if "features_storage" in data else "float32"
+    if stored != "float32":
+        print(f"❌ {FEATURE_FILE} 已是 {stored} 格式，請以 --storage float32 重新執行 python -m ceramics extract 作為基準")
+        return
+
+    labels = data["labels"].astype(str)
+    class_names, y = np.unique(labels, return_inverse=True)
+    components = np.load(PCA_COMPONENT_FILE)
+    scaler_mean = np.load(SCALER_MEAN_FILE)
+    scaler_scale = np.load(SCALER_SCALE_FILE)
+    n = reference.shape[0]
+    counts = np.bincount(y, minlength=len(class_names))
+
+    def project(X):
+        # 與 ceramics/extract.py 相同的 StandardScaler + PCA 投影（PCA mean 對兩者相同，比較時抵銷）
+        return ((X - scaler_mean) / scaler_scale) @ components.T
+
+    ref_pca_std = None
+    ref_means = None
+    report = {"method": method, "n_samples": int(n), "modes": {}}
+    mode_means = {}
+
+    for mode in STORAGE_MODES:
+        sq_err, max_err, pca_sq_err, pca_max_err = 0.0, 0.0, 0.0, 0.0
+        class_sums = np.zeros((len(class_names), reference.shape[1]), dtype=np.float64)
+        ref_sums = np.zeros_like(class_sums)
+        pca_ref_sq = 0.0
+        size = 0
+
+        # 分塊量化 / 還原，避免同時持有多份 (N, D) 陣列
+        for start in range(0, n, BLOCK_SIZE):
+            block = reference[start:start + BLOCK_SIZE]
+            stored_block = quantize_features(block, mode)
+            size += compressed_size(stored_block)
+            restored = dequantize_features(stored_block)
+
+            diff = restored - block
+            sq_err += float((diff.astype(np.float64) ** 2).sum())
+            max_err = max(max_err, float(np.abs(diff).max()))
+
+            ref_proj, q_proj = project(block), project(restored)
+            pca_sq_err += float(((q_proj - ref_proj) ** 2).sum())
+            pca_max_err = max(pca_max_err, float(np.abs(q_proj - ref_proj).max()))
+            pca_ref_sq += float((ref_proj ** 2).sum())
+
+            onehot = np.zeros((block.shape[0], len(class_names)))
+            onehot[np.arange(block.shape[0]), y[start:start + BLOCK_SIZE]] = 1
+            class_sums += onehot.T @ restored
+            ref_sums += onehot.T @ block
+
+        means = class_sums / counts[:, None]
+        if ref_means is None:
+            ref_means = ref_sums / counts[:, None]
+            ref_pca_std = np.sqrt(pca_ref_sq / (n * components.shape[0]))
+        mean_rmse = np.sqrt(((means - ref_means) ** 2).mean(axis=1))
+
+        result = {
+            "compressed_bytes": int(size),
+            "latent_rmse": float(np.sqrt(sq_err / reference.size)),
+            "latent_max_abs_error": max_err,
+            "pca_rmse": float(np.sqrt(pca_sq_err / (n * components.shape[0]))),
+            "pca_rmse_relative": float(np.sqrt(pca_sq_err / (n * components.shape[0])) / ref_pca_std),
+            "pca_max_abs_error": pca_max_err,
+            "mean_object_latent_rmse": {c: float(e) for c, e in zip(class_names, mean_rmse)},
+        }
+        report["modes"][mode] = result
+        mode_means[mode] = means
+        print(f"📊 {mode}: {size / 1e6:.1f} MB, latent RMSE {result['latent_rmse']:.3e}, "
+              f"PCA RMSE {result['pca_rmse_relative']:.3%}, mean object RMSE 最大 {mean_rmse.max():.3e}")
+
+    # 解碼 mean object 比較像素誤差
+    if decode:
+        decode_images = load_decoder()
+        ref_imgs = decode_images(ref_means)
+        for mode, means in mode_means.items():
+            if mode == "float32":
+                continue
+            mse = ((decode_images(means) - ref_imgs) ** 2).reshape(len(class_names), -1).mean(axis=1)
+            psnr = 10 * np.log10(1.0 / np.maximum(mse, 1e-12))
+            report["modes"][mode]["mean_object_psnr_db"] = {c: float(p) for c, p in zip(class_names, psnr)}
+            print(f"🖼️ {mode}: mean object PSNR 最低 {psnr.min():.2f} dB")
+
+    with open(REPORT_FILE, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=4)
+    print(f"✅ 量化驗證報告已儲存：{REPORT_FILE}")
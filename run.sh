@@ -1,34 +1,44 @@
 mkdir raw_data
 curl -L "https://odapi.npm.gov.tw/data/open/api/v1/digitalCollection/ceramics.json" -o "raw_data/ceramics.json"
-python build_dataset.py
+python -m ceramics build
 
-python download_picture.py --method decoration
-python download_picture.py --method dynasty
-python download_picture.py --method glaze
-python download_picture.py --method kiln
-python download_picture.py --method shape
+python -m ceramics download --method decoration
+python -m ceramics dedup --method decoration
+python -m ceramics download --method dynasty
+python -m ceramics dedup --method dynasty
+python -m ceramics download --method glaze
+python -m ceramics dedup --method glaze
+python -m ceramics download --method kiln
+python -m ceramics dedup --method kiln
+python -m ceramics download --method shape
+python -m ceramics dedup --method shape
 
-python extract_features.py --method decoration
-python clusters.py --method decoration
-python meanobject.py --method decoration
-python visual_pca.py --method decoration
+python -m ceramics extract --method decoration --dedup
+python -m ceramics cluster --method decoration
+python -m ceramics separability --method decoration
+python -m ceramics meanobject --method decoration
+python -m ceramics pca-grid --method decoration
 
-python extract_features.py --method dynasty
-python clusters.py --method dynasty
-python meanobject.py --method dynasty
-python visual_pca.py --method dynasty
+python -m ceramics extract --method dynasty --dedup
+python -m ceramics cluster --method dynasty
+python -m ceramics separability --method dynasty
+python -m ceramics meanobject --method dynasty
+python -m ceramics pca-grid --method dynasty
 
-python extract_features.py --method glaze
-python clusters.py --method glaze
-python meanobject.py --method glaze
-python visual_pca.py --method glaze
+python -m ceramics extract --method glaze --dedup
+python -m ceramics cluster --method glaze
+python -m ceramics separability --method glaze
+python -m ceramics meanobject --method glaze
+python -m ceramics pca-grid --method glaze
 
-python extract_features.py --method kiln
-python clusters.py --method kiln
-python meanobject.py --method kiln
-python visual_pca.py --method kiln
+python -m ceramics extract --method kiln --dedup
+python -m ceramics cluster --method kiln
+python -m ceramics separability --method kiln
+python -m ceramics meanobject --method kiln
+python -m ceramics pca-grid --method kiln
 
-python extract_features.py --method shape
-python clusters.py --method shape
-python meanobject.py --method shape
-python visual_pca.py --method shape
\ No newline at end of file
+python -m ceramics extract --method shape --dedup
+python -m ceramics cluster --method shape
+python -m ceramics separability --method shape
+python -m ceramics meanobject --method shape
+python -m ceramics pca-grid --method shape
\ No newline at end of file